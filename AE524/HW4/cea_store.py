@@ -0,0 +1,330 @@
+import os
+import re
+import sys
+import glob
+import math
+import pandas as pd
+
+# HDF5 file and table key used for the CEA reference data.
+store_path = 'cea_results.h5'
+store_key = 'cea'
+sources_key = 'cea_sources'
+
+# Columns the store is indexed on. Every record is stored in long format,
+# one row per (case, station, property), so cases with different product
+# species can be appended to the same table.
+index_columns = ['r', 'area_ratio', 'pc', 'mode']
+
+# Properties renamed to the column names used by combustion_calc.py and the
+# hand-typed CEA tables (scale factor applied to the CEA value).
+repo_aliases = {
+    'Isp, M/SEC': ('I_sp (s)', 1 / 9.80665),
+    'M, (1/n)': ('MW', 1.0),
+    'GAMMAs': ('γ', 1.0),
+    'CF': ('C_T', 1.0),
+    'CSTAR, M/SEC': ('C^*', 1.0),
+}
+
+# Chamber pressure labels CEA may print, with the factor to convert to bar.
+pressure_labels = {'P, BAR': 1.0, 'P, ATM': 1.01325, 'P, MPA': 10.0}
+
+# CEA writes small numbers as a mantissa followed by a signed exponent
+# (e.g. 6.8067-1), and zero exponents as a separate token (e.g. 1.1117 0).
+cea_number = re.compile(r'^([-+]?\d*\.\d+|[-+]?\d+\.?)([-+]\d+)?$')
+cea_exponent = re.compile(r'^[-+]?\d+$')
+
+# Freezing point station echoed from the input deck (nfz=1 is the chamber).
+cea_nfz = re.compile(r'\bnfz\s*=?\s*(\d+)', re.IGNORECASE)
+
+def parse_cea_number(token: str) -> float:
+    """Convert a single CEA output token to a float (raises ValueError if it is not a number)."""
+    match = cea_number.match(token)
+    if match is None:
+        raise ValueError(f"Not a CEA number: {token!r}")
+    mantissa, exponent = match.groups()
+    return float(mantissa) * 10.0 ** int(exponent or 0)
+
+def split_cea_row(line: str) -> tuple:
+    """Split a CEA table row into its label and the list of numeric values that follow it."""
+    tokens = line.split()
+    values = []
+    # Walk back from the end of the line until a token is not numeric.
+    i = len(tokens)
+    while i > 0:
+        try:
+            value = parse_cea_number(tokens[i - 1])
+        except ValueError:
+            break
+        values.insert(0, value)
+        i -= 1
+    # Fold detached zero exponents ("1.1117 0") back into the preceding mantissa.
+    numbers = tokens[i:]
+    merged = []
+    for j, (token, value) in enumerate(zip(numbers, values)):
+        if j > 0 and cea_exponent.match(token) and '.' in numbers[j - 1]:
+            merged[-1] *= 10.0 ** int(token)
+        else:
+            merged.append(value)
+    return ' '.join(tokens[:i]), merged
+
+def split_species_row(line: str) -> list:
+    """Split a MOLE/MASS FRACTIONS row into (species, values) pairs; frozen runs print several per line."""
+    pairs = []
+    for token in line.split():
+        try:
+            value = parse_cea_number(token)
+        except ValueError:
+            pairs.append((token.lstrip('*'), []))
+            continue
+        if pairs:
+            pairs[-1][1].append(value)
+    return pairs
+
+def case_records(case: dict) -> list:
+    """Flatten one parsed CEA case into long-format rows for the store."""
+    stations = case['stations']
+    properties = case['properties']
+
+    # Chamber pressure and area ratios are needed for the index.
+    pc = math.nan
+    for label, factor in pressure_labels.items():
+        if label in properties:
+            pc = properties[label][0] * factor
+            break
+    area_ratios = list(properties.get('Ae/At', [math.nan] * len(stations)))
+    for i, name in enumerate(stations):
+        if name in ('CHAMBER', 'INJECTOR'):
+            area_ratios[i] = math.inf
+        elif name == 'COMB END' and 'Ac/At' in properties:
+            area_ratios[i] = properties['Ac/At'][i]
+
+    # Subsonic and supersonic exits can share an area ratio (subar=2, supar=2),
+    # so subsonic exits get their own station label.
+    mach = properties.get('MACH NUMBER', [math.nan] * len(stations))
+    stations = [name + ' (sub)' if name == 'EXIT' and m < 1 else name
+                for name, m in zip(stations, mach)]
+
+    records = []
+    for label, values in properties.items():
+        for name, area_ratio, value in zip(stations, area_ratios, values):
+            if math.isnan(value):
+                continue
+            key = {'r': case['r'], 'area_ratio': area_ratio, 'pc': pc, 'mode': case['mode']}
+            records.append({**key, 'station': name, 'property': label, 'value': value})
+            if label in repo_aliases:
+                alias, factor = repo_aliases[label]
+                records.append({**key, 'station': name, 'property': alias, 'value': value * factor})
+    return records
+
+def parse_cea_output(path: str):
+    """
+    Stream the cases out of a NASA CEA rocket .out file, one case at a time.
+    Every thermodynamic, performance, transport and composition row is kept.
+    Both the infinite area combustor (CHAMBER, THROAT, EXIT...) and finite
+    area combustor (INJECTOR, COMB END, THROAT, EXIT...) layouts are read.
+    The chamber or injector is stored at an area ratio of infinity and the
+    combustor end at its contraction ratio Ac/At.
+    Yields lists of long-format records (see case_records).
+    """
+    case = None
+    section = None
+    suffix = ''
+    nfz = 1
+    in_deck = False
+    with open(path, 'r', errors='replace') as file:
+        for raw in file:
+            line = raw.strip()
+
+            # A new rocket problem (or a continuation page of more exits) starts here.
+            if line.startswith('THEORETICAL ROCKET PERFORMANCE ASSUMING'):
+                if case is not None and case['stations']:
+                    yield case_records(case)
+                mode = 'frozen' if 'FROZEN' in line else 'equilibrium'
+                case = {'mode': mode, 'r': math.nan, 'stations': [], 'properties': {}}
+                section = None
+                suffix = ''
+                in_deck = False
+                continue
+
+            # Each problem's input deck is echoed before its output and sets its own nfz.
+            keyword = line.split()[0].lower() if line else ''
+            if keyword.startswith('prob'):
+                nfz = 1
+                in_deck = True
+            if in_deck or case is None:
+                match = cea_nfz.search(line)
+                if match:
+                    nfz = int(match.group(1))
+                if keyword == 'end':
+                    in_deck = False
+                continue
+
+            if line.startswith('O/F='):
+                case['r'] = parse_cea_number(line.split()[1])
+            elif line.startswith('CHAMBER') or line.startswith('INJECTOR'):
+                # Station names are separated by 2+ spaces ("COMB END" is one station).
+                case['stations'] = re.split(r'\s{2,}', line)
+                section = 'thermo'
+            elif line in ('PERFORMANCE PARAMETERS', 'TRANSPORT PROPERTIES (GASES ONLY)'):
+                section = 'thermo'
+                suffix = ''
+            elif line in ('MOLE FRACTIONS', 'MASS FRACTIONS'):
+                section = 'Y_' if line == 'MOLE FRACTIONS' else 'w_'
+                case['composition_rows'] = 0
+            elif line.startswith('WITH EQUILIBRIUM REACTIONS'):
+                suffix = ' (eq. reactions)'
+            elif line.startswith('WITH FROZEN REACTIONS'):
+                suffix = ' (fz. reactions)'
+            elif not line:
+                # The composition table ends at the first blank line after its rows.
+                if section in ('Y_', 'w_') and case['composition_rows']:
+                    section = None
+            elif section == 'thermo':
+                label, values = split_cea_row(line)
+                if label and values:
+                    # Performance rows skip the chamber column, so right-align them.
+                    n = len(case['stations'])
+                    values = [math.nan] * (n - len(values)) + values[-n:]
+                    case['properties'][label + suffix] = values
+            elif section in ('Y_', 'w_'):
+                n = len(case['stations'])
+                for species, values in split_species_row(line):
+                    if not values:
+                        continue
+                    # Frozen runs print one column, the composition at the freezing
+                    # point (station nfz), which holds from there to the exit.
+                    if len(values) == 1:
+                        frozen_at = min(nfz, n) - 1
+                        values = [math.nan] * frozen_at + values * (n - frozen_at)
+                    case['properties'][section + species] = values
+                    case['composition_rows'] += 1
+
+    if case is not None and case['stations']:
+        yield case_records(case)
+
+def ingest_cea_directory(directory: str, path: str = store_path, batch_size: int = 500) -> int:
+    """
+    Parse every .out file under a directory and append the cases to the HDF5 store.
+    Files already in the store (same path and modification time) are skipped, and
+    files that changed since they were ingested have their old rows replaced.
+    Cases are written in batches so large directories never sit in memory at once.
+    Returns the number of records written.
+    """
+    files = sorted(glob.glob(os.path.join(directory, '**', '*.out'), recursive=True))
+    written = 0
+    batch = []
+    batch_sources = []
+    # Only an existing store is opened up front, so an empty directory leaves no file behind.
+    store = pd.HDFStore(path, mode='a') if os.path.exists(path) else None
+    if store is not None and sources_key in store:
+        sources = store.select(sources_key)
+    else:
+        sources = pd.DataFrame({'source': pd.Series(dtype='int64'),
+                                'path': pd.Series(dtype='object'),
+                                'mtime': pd.Series(dtype='float64')})
+    # Ids come from a running counter so files waiting in the same batch never share one.
+    next_source = int(sources['source'].max()) + 1 if len(sources) else 0
+
+    def flush():
+        nonlocal store, sources
+        if store is None:
+            store = pd.HDFStore(path, mode='a')
+        if batch:
+            frame = pd.concat(batch, ignore_index=True)
+            store.append(store_key, frame, format='table', data_columns=index_columns + ['source'],
+                         min_itemsize={'mode': 16, 'station': 16, 'property': 48}, index=False)
+        # Files are recorded only once their rows are on disk.
+        sources = pd.concat([sources, pd.DataFrame(batch_sources)], ignore_index=True)
+        store.put(sources_key, sources, format='table', min_itemsize={'path': 256})
+        return sum(len(frame) for frame in batch)
+
+    try:
+        for file_name in files:
+            file_path = os.path.abspath(file_name)
+            mtime = os.path.getmtime(file_path)
+            previous = sources[sources['path'] == file_path]
+            if (previous['mtime'] == mtime).any():
+                continue
+            # The file changed since it was ingested, so drop its old rows first
+            # (files without rocket cases never created the table).
+            if len(previous) and store_key in store:
+                for source in previous['source']:
+                    store.remove(store_key, where=f'source == {int(source)}')
+            sources = sources[sources['path'] != file_path]
+
+            source = next_source
+            next_source += 1
+            records = [record for case in parse_cea_output(file_name) for record in case]
+            if records:
+                # Continuation pages repeat the chamber and throat columns of a case.
+                frame = pd.DataFrame(records).drop_duplicates(
+                    subset=index_columns + ['station', 'property'], keep='last')
+                frame['source'] = source
+                batch.append(frame)
+            batch_sources.append({'source': source, 'path': file_path, 'mtime': mtime})
+            if sum(len(frame) for frame in batch) >= batch_size:
+                written += flush()
+                batch = []
+                batch_sources = []
+        if batch_sources:
+            written += flush()
+
+        # A fully sorted index lets range queries skip straight to matching rows.
+        if store is not None and store_key in store:
+            store.create_table_index(store_key, columns=index_columns, optlevel=9, kind='full')
+    finally:
+        if store is not None:
+            store.close()
+    return written
+
+def query_cea(mode: str = None, r: tuple = None, area_ratio: tuple = None, pc: tuple = None,
+              path: str = store_path) -> pd.DataFrame:
+    """
+    Select CEA cases from the store and return them one row per (r, area ratio, pc, mode)
+    and station, so a subsonic exit is kept apart from a supersonic one of the same Ae/At.
+    Each of r, area_ratio and pc is an inclusive (low, high) range; None means no limit.
+    Properties become columns, so the result lines up with combustion_results.csv.
+    """
+    # PyTables cannot parse inf in a condition. An infinite bound on the open side
+    # is no limit at all, and one on the closed side (e.g. area_ratio >= inf to
+    # pick out the chamber) is replaced by the largest finite float.
+    conditions = []
+    if mode is not None:
+        conditions.append(f'mode == {mode!r}')
+    for column, bounds in (('r', r), ('area_ratio', area_ratio), ('pc', pc)):
+        if bounds is None:
+            continue
+        low, high = bounds
+        if low is not None and float(low) != -math.inf:
+            conditions.append(f'{column} >= {min(float(low), sys.float_info.max)!r}')
+        if high is not None and float(high) != math.inf:
+            conditions.append(f'{column} <= {max(float(high), -sys.float_info.max)!r}')
+
+    with pd.HDFStore(path, mode='r') as store:
+        long_df = store.select(store_key, where=' & '.join(conditions) or None)
+
+    # The same case run in two different files keeps the one ingested last.
+    wide_df = long_df.pivot_table(index=index_columns + ['station'], columns='property', values='value',
+                                  aggfunc='last')
+    wide_df.columns.name = None
+    return wide_df.sort_index().reset_index()
+
+def main() -> None:
+    """
+    Ingest a directory of CEA .out files (default: cea_output) into
+    cea_results.h5, then print the equilibrium and frozen cases that were stored.
+    """
+    directory = sys.argv[1] if len(sys.argv) > 1 else 'cea_output'
+    written = ingest_cea_directory(directory)
+    if not os.path.exists(store_path):
+        print(f"No CEA .out files found in {directory}, nothing to store")
+        return
+    print(f"Stored {written} records from {directory} in {store_path}")
+
+    for mode in ('equilibrium', 'frozen'):
+        print(f"\nCEA results ({mode}):")
+        print(query_cea(mode=mode))
+
+# Call the main function
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import os
+import math
+import shutil
+import pytest
+
+pytest.importorskip('pandas')
+import cea_store
+
+# Trimmed CEA2 output files used as fixtures.
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cea_test_data')
+iac_file = os.path.join(data_dir, 'iac_equilibrium_frozen.out')
+fac_file = os.path.join(data_dir, 'fac_equilibrium.out')
+
+def parsed_values(path: str, mode: str, prop: str) -> dict:
+    """Return {station: value} for one property of the cases in a file with the given mode."""
+    return {record['station']: record['value']
+            for records in cea_store.parse_cea_output(path)
+            for record in records
+            if record['mode'] == mode and record['property'] == prop}
+
+def test_parse_cea_number():
+    assert cea_store.parse_cea_number('6.8067-1') == pytest.approx(0.68067)
+    assert cea_store.parse_cea_number('4.5-6') == pytest.approx(4.5e-6)
+    assert cea_store.parse_cea_number('1378.20') == pytest.approx(1378.20)
+    with pytest.raises(ValueError):
+        cea_store.parse_cea_number('*OH')
+
+def test_split_cea_row_folds_detached_exponents():
+    label, values = cea_store.split_cea_row(' RHO, KG/CU M    3.4076 0 2.0879 0 9.2233-2')
+    assert label == 'RHO, KG/CU M'
+    assert values == pytest.approx([3.4076, 2.0879, 9.2233e-2])
+
+def test_equilibrium_properties():
+    rho = parsed_values(iac_file, 'equilibrium', 'RHO, KG/CU M')
+    assert rho['EXIT'] == pytest.approx(9.2233e-2)
+    assert rho['CHAMBER'] == pytest.approx(3.4076)
+
+    # Performance rows have no chamber column and are right-aligned.
+    isp = parsed_values(iac_file, 'equilibrium', 'I_sp (s)')
+    assert set(isp) == {'THROAT', 'EXIT'}
+    assert isp['EXIT'] == pytest.approx(4118.5 / 9.80665)
+
+    frozen_cp = parsed_values(iac_file, 'equilibrium', 'Cp, KJ/(KG)(K) (fz. reactions)')
+    assert frozen_cp['CHAMBER'] == pytest.approx(3.6040)
+
+    # The species table ends before the list of products that were not formed.
+    y_oh = parsed_values(iac_file, 'equilibrium', 'Y_OH')
+    assert y_oh['EXIT'] == pytest.approx(0.00002)
+    assert 'Y_CH2' not in {record['property']
+                           for records in cea_store.parse_cea_output(iac_file)
+                           for record in records}
+
+def test_frozen_composition_starts_at_nfz():
+    y_oh = parsed_values(iac_file, 'frozen', 'Y_OH')
+    assert set(y_oh) == {'THROAT', 'EXIT'}
+    # Frozen at the throat, so the throat composition (not the chamber's) carries to the exit.
+    assert y_oh['THROAT'] == pytest.approx(0.02303)
+    assert y_oh['EXIT'] == pytest.approx(0.02303)
+
+def test_finite_area_combustor():
+    records = [record for records in cea_store.parse_cea_output(fac_file) for record in records]
+    keys = {record['station']: (record['area_ratio'], record['pc']) for record in records}
+    assert keys == {'INJECTOR': (math.inf, 20.684), 'COMB END': (2.0, 20.684),
+                    'THROAT': (1.0, 20.684), 'EXIT': (25.0, 20.684)}
+
+def test_store_ingest_and_query(tmp_path):
+    pytest.importorskip('tables')
+    path = str(tmp_path / 'cea_results.h5')
+
+    written = cea_store.ingest_cea_directory(data_dir, path)
+    assert written > 0
+    # Files already in the store are skipped.
+    assert cea_store.ingest_cea_directory(data_dir, path) == 0
+
+    chamber_df = cea_store.query_cea(area_ratio=(10, math.inf), pc=(60, None), path=path)
+    assert list(chamber_df['area_ratio']) == [math.inf, math.inf]
+
+    frozen_df = cea_store.query_cea(mode='frozen', r=(5, 7), area_ratio=(2, 30), path=path)
+    assert len(frozen_df) == 1
+    assert frozen_df.loc[0, 'C_T'] == pytest.approx(1.7700)
+    assert frozen_df.loc[0, 'Y_OH'] == pytest.approx(0.02303)
+
+def test_empty_directory_creates_no_store(tmp_path):
+    path = str(tmp_path / 'cea_results.h5')
+    assert cea_store.ingest_cea_directory(str(tmp_path), path) == 0
+    assert not os.path.exists(path)
+
+def test_reingest_changed_file_keeps_other_files(tmp_path):
+    pytest.importorskip('tables')
+    source_dir = tmp_path / 'cea_output'
+    shutil.copytree(data_dir, source_dir)
+    path = str(tmp_path / 'cea_results.h5')
+    cea_store.ingest_cea_directory(str(source_dir), path)
+    frozen_before = cea_store.query_cea(mode='frozen', path=path)
+
+    # Only the FAC file changes, so only its rows may be replaced.
+    fac_copy = source_dir / 'fac_equilibrium.out'
+    mtime = os.path.getmtime(fac_copy) + 10
+    os.utime(fac_copy, (mtime, mtime))
+    assert cea_store.ingest_cea_directory(str(source_dir), path) > 0
+
+    frozen_after = cea_store.query_cea(mode='frozen', path=path)
+    assert len(frozen_after) == len(frozen_before) > 0
+
+def test_reingest_changed_file_without_cases(tmp_path):
+    pytest.importorskip('tables')
+    source_dir = tmp_path / 'cea_output'
+    source_dir.mkdir()
+    empty_file = source_dir / 'empty.out'
+    empty_file.write_text(' NASA-GLENN CHEMICAL EQUILIBRIUM PROGRAM CEA2\n')
+    path = str(tmp_path / 'cea_results.h5')
+    assert cea_store.ingest_cea_directory(str(source_dir), path) == 0
+
+    mtime = os.path.getmtime(empty_file) + 10
+    os.utime(empty_file, (mtime, mtime))
+    assert cea_store.ingest_cea_directory(str(source_dir), path) == 0
+
+def test_nfz_is_read_per_problem(tmp_path):
+    with open(iac_file) as file:
+        text = file.read()
+    # The second problem in the file freezes at the chamber (no nfz in its deck).
+    batch_file = tmp_path / 'batch.out'
+    batch_file.write_text(text + text.replace(' nfz=2', ''))
+    frozen_stations = [{record['station'] for record in records if record['property'] == 'Y_OH'}
+                       for records in cea_store.parse_cea_output(str(batch_file))
+                       if records[0]['mode'] == 'frozen']
+    assert frozen_stations == [{'THROAT', 'EXIT'}, {'CHAMBER', 'THROAT', 'EXIT'}]
+
+def test_subsonic_and_supersonic_exits_at_same_area_ratio(tmp_path):
+    pytest.importorskip('tables')
+    subsonic_file = os.path.join(data_dir, 'iac_subsonic_exit.out')
+    isp = parsed_values(subsonic_file, 'equilibrium', 'Isp, M/SEC')
+    assert isp == {'THROAT': 1508.3, 'EXIT (sub)': 482.1, 'EXIT': 3130.4}
+
+    source_dir = tmp_path / 'cea_output'
+    source_dir.mkdir()
+    shutil.copy(subsonic_file, source_dir)
+    path = str(tmp_path / 'cea_results.h5')
+    cea_store.ingest_cea_directory(str(source_dir), path)
+    exits_df = cea_store.query_cea(area_ratio=(2, 2), path=path)
+    assert sorted(exits_df['station']) == ['EXIT', 'EXIT (sub)']